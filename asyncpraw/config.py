@@ -133,6 +133,10 @@ class Config:
             self._fetch_default("warn_additional_fetch_params", default=True)
         )
         self.window_size = self._fetch_default("window_size", default=600)
+        self.cache_ttl = self._fetch_default("cache_ttl", default=0)
+        self.max_concurrent_uploads = self._fetch_default(
+            "max_concurrent_uploads", default=4
+        )
         self.kinds = {
             x: self._fetch(f"{x}_kind")
             for x in [
@@ -165,6 +169,8 @@ class Config:
             setattr(self, required_attribute, self._fetch(required_attribute))
 
         for attribute, conversion in {
+            "cache_ttl": float,
+            "max_concurrent_uploads": int,
             "ratelimit_seconds": int,
             "timeout": int,
         }.items():
@@ -173,3 +179,7 @@ class Config:
             except ValueError:
                 msg = f"An incorrect config type was given for option {attribute}. The expected type is {conversion.__name__}, but the given value is {getattr(self, attribute)}."
                 raise ValueError(msg) from None
+
+        if self.max_concurrent_uploads < 1:
+            msg = f"max_concurrent_uploads must be at least 1, but the given value is {self.max_concurrent_uploads}."
+            raise ValueError(msg)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-from json import dumps
 from typing import TYPE_CHECKING, Any, Generator
 from urllib.parse import urljoin
 from warnings import warn
@@ -13,6 +12,7 @@ from asyncprawcore import Conflict
 from ...const import API_PATH
 from ...exceptions import InvalidURL
 from ...util import _deprecate_args, cachedproperty
+from ...util.json_utils import dumps
 from ..comment_forest import CommentForest
 from ..listing.listing import Listing
 from ..listing.mixins import SubmissionListingMixin
@@ -712,10 +712,7 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Reddit
             is_richtext_json = True
         if inline_media:
             body = body.format(
-                **{
-                    placeholder: await self.subreddit._upload_inline_media(media)
-                    for placeholder, media in inline_media.items()
-                }
+                **await self.subreddit._upload_all_inline_media(inline_media)
             )
             is_richtext_json = True
         if is_richtext_json:
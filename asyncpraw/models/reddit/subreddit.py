@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import contextlib
-from asyncio import TimeoutError
+from asyncio import TimeoutError, sleep
 from copy import deepcopy
 from csv import writer
+from functools import partial
 from io import StringIO
-from json import dumps
 from pathlib import Path
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,7 +19,6 @@ from typing import (
 )
 from urllib.parse import urljoin
 from warnings import warn
-from xml.etree.ElementTree import XML
 
 from aiohttp.http_exceptions import HttpProcessingError
 from aiohttp.web_ws import WebSocketError
@@ -35,6 +35,7 @@ from ...exceptions import (
     WebSocketException,
 )
 from ...util import _deprecate_args, cachedproperty
+from ...util.json_utils import dumps, loads
 from ..listing.generator import ListingGenerator
 from ..listing.mixins import SubredditListingMixin
 from ..util import deprecate_lazy, permissions_string, stream_generator
@@ -52,6 +53,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
     import asyncpraw.models
 
+_DEFAULT_UPLOAD_FILE = (
+    Path(__file__).resolve().parent.parent.parent / "images" / "PRAW logo.png"
+)
+
 
 class Modmail:
     """Provides modmail functions for a :class:`.Subreddit`.
@@ -727,6 +732,14 @@ class SubredditFlairTemplates:
         text_color: str | None = None,
         text_editable: bool = False,
     ):
+        if allowable_content not in {None, "all", "emoji", "text"}:
+            msg = (
+                "'allowable_content' argument must be either 'all', 'emoji', or 'text'"
+            )
+            raise ValueError(msg)
+        if text_color not in {None, "dark", "light"}:
+            msg = "'text_color' argument must be either 'light' or 'dark'"
+            raise ValueError(msg)
         url = API_PATH["flairtemplate_v2"].format(subreddit=self.subreddit)
         data = {
             "allowable_content": allowable_content,
@@ -740,12 +753,29 @@ class SubredditFlairTemplates:
             "text_editable": bool(text_editable),
         }
         await self.subreddit._reddit.post(url, data=data)
+        self._clear_user_selectable_cache()
 
     async def _clear(self, *, is_link: bool | None = None):
         url = API_PATH["flairtemplateclear"].format(subreddit=self.subreddit)
         await self.subreddit._reddit.post(
             url, data={"flair_type": self.flair_type(is_link)}
         )
+        self._clear_user_selectable_cache()
+
+    def _clear_user_selectable_cache(self):
+        self.subreddit._reddit._user_selectable_cache.pop(
+            self.subreddit.display_name.lower(), None
+        )
+
+    @staticmethod
+    async def _iterate_templates(
+        templates: list[dict[str, Any]],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield ``templates``, giving control to the event loop every 32 templates."""
+        for index, template in enumerate(templates, start=1):
+            yield template
+            if index % 32 == 0:
+                await sleep(0)
 
     async def _reorder(self, flair_list: list, *, is_link: bool | None = None):
         url = API_PATH["flairtemplatereorder"].format(subreddit=self.subreddit)
@@ -757,6 +787,7 @@ class SubredditFlairTemplates:
             },
             json=flair_list,
         )
+        self._clear_user_selectable_cache()
 
     async def delete(self, template_id: str):
         """Remove a flair template provided by ``template_id``.
@@ -772,6 +803,7 @@ class SubredditFlairTemplates:
         """
         url = API_PATH["flairtemplatedelete"].format(subreddit=self.subreddit)
         await self.subreddit._reddit.post(url, data={"flair_template_id": template_id})
+        self._clear_user_selectable_cache()
 
     @_deprecate_args(
         "template_id",
@@ -862,6 +894,7 @@ class SubredditFlairTemplates:
                 if data.get(key) is None:
                     data[key] = value
         await self.subreddit._reddit.post(url, data=data)
+        self._clear_user_selectable_cache()
 
 
 class SubredditModeration:
@@ -1849,7 +1882,7 @@ class SubredditStylesheet:
         # TODO(@LilSpazJoekp): This is a blocking operation. It should be made async.
         with file.open("rb") as image:  # noqa: ASYNC230
             upload_data["file"] = image
-            response = await self.subreddit._reddit._core._requestor._http.post(
+            response = await self.subreddit._reddit._http.post(
                 upload_url, data=upload_data
             )
         response.raise_for_status()
@@ -2749,6 +2782,13 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
     STR_FIELD = "display_name"
     MESSAGE_PREFIX = "#"
 
+    @staticmethod
+    def _add_optional_fields(data: dict[str, Any], **fields: Any):
+        """Add each of ``fields`` whose value is not ``None`` to ``data``."""
+        data.update(
+            (field, value) for field, value in fields.items() if value is not None
+        )
+
     @staticmethod
     async def _create_or_update(
         *,
@@ -2789,45 +2829,77 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
         **other_settings: Any,
     ):
         model = {
-            "allow_images": allow_images,
-            "allow_post_crossposts": allow_post_crossposts,
-            "allow_top": allow_top,
-            "collapse_deleted_comments": collapse_deleted_comments,
-            "comment_score_hide_mins": comment_score_hide_mins,
-            "description": description,
-            "domain": domain,
-            "exclude_banned_modqueue": exclude_banned_modqueue,
-            "header-title": header_hover_text,  # Remap here - better name
-            "hide_ads": hide_ads,
-            "key_color": key_color,
-            "lang": lang,
-            "link_type": link_type,
-            "name": name,
-            "over_18": over_18,
-            "public_description": public_description,
-            "public_traffic": public_traffic,
-            "show_media": show_media,
-            "show_media_preview": show_media_preview,
-            "spam_comments": spam_comments,
-            "spam_links": spam_links,
-            "spam_selfposts": spam_selfposts,
-            "spoilers_enabled": spoilers_enabled,
-            "sr": sr,
-            "submit_link_label": submit_link_label,
-            "submit_text": submit_text,
-            "submit_text_label": submit_text_label,
-            "suggested_comment_sort": suggested_comment_sort,
-            "title": title,
-            "type": subreddit_type,
-            "wiki_edit_age": wiki_edit_age,
-            "wiki_edit_karma": wiki_edit_karma,
-            "wikimode": wikimode,
+            key: value
+            for key, value in (
+                ("allow_images", allow_images),
+                ("allow_post_crossposts", allow_post_crossposts),
+                ("allow_top", allow_top),
+                ("collapse_deleted_comments", collapse_deleted_comments),
+                ("comment_score_hide_mins", comment_score_hide_mins),
+                ("description", description),
+                ("domain", domain),
+                ("exclude_banned_modqueue", exclude_banned_modqueue),
+                ("header-title", header_hover_text),  # Remap here - better name
+                ("hide_ads", hide_ads),
+                ("key_color", key_color),
+                ("lang", lang),
+                ("link_type", link_type),
+                ("name", name),
+                ("over_18", over_18),
+                ("public_description", public_description),
+                ("public_traffic", public_traffic),
+                ("show_media", show_media),
+                ("show_media_preview", show_media_preview),
+                ("spam_comments", spam_comments),
+                ("spam_links", spam_links),
+                ("spam_selfposts", spam_selfposts),
+                ("spoilers_enabled", spoilers_enabled),
+                ("sr", sr),
+                ("submit_link_label", submit_link_label),
+                ("submit_text", submit_text),
+                ("submit_text_label", submit_text_label),
+                ("suggested_comment_sort", suggested_comment_sort),
+                ("title", title),
+                ("type", subreddit_type),
+                ("wiki_edit_age", wiki_edit_age),
+                ("wiki_edit_karma", wiki_edit_karma),
+                ("wikimode", wikimode),
+            )
+            if value is not None
         }
 
         model.update(other_settings)
 
         await _reddit.post(API_PATH["site_admin"], data=model)
 
+    @staticmethod
+    def _media_mime_type(*, expected_mime_prefix: str | None, file: Path) -> str:
+        """Return the mimetype of ``file`` based on its extension.
+
+        :param expected_mime_prefix: If provided, enforce that the media has a mime type
+            that starts with the provided prefix.
+        :param file: The path to the media file.
+
+        """
+        file_extension = file.suffix[1:].lower()
+        mime_type = {
+            "png": "image/png",
+            "mov": "video/quicktime",
+            "mp4": "video/mp4",
+            "jpg": "image/jpeg",
+            "jpeg": "image/jpeg",
+            "gif": "image/gif",
+        }.get(
+            file_extension, "image/jpeg"
+        )  # default to JPEG
+        if (
+            expected_mime_prefix is not None
+            and mime_type.partition("/")[0] != expected_mime_prefix
+        ):
+            msg = f"Expected a mimetype starting with {expected_mime_prefix!r} but got mimetype {mime_type!r} (from file extension {file_extension!r})."
+            raise ClientException(msg)
+        return mime_type
+
     @staticmethod
     def _subreddit_list(
         *,
@@ -2859,6 +2931,14 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             msg = f"{inline_media.path!r} is not a valid file path."
             raise ValueError(msg)
 
+    @cachedproperty
+    def _search_url(self) -> str:
+        return API_PATH["search"].format(subreddit=self)
+
+    @cachedproperty
+    def _sticky_url(self) -> str:
+        return API_PATH["about_sticky"].format(subreddit=self)
+
     @cachedproperty
     def banned(self) -> asyncpraw.models.reddit.subreddit.SubredditRelationship:
         """Provide an instance of :class:`.SubredditRelationship`.
@@ -3256,6 +3336,8 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
 
     async def _parse_xml_response(self, response: ClientResponse):
         """Parse the XML from a response and raise any errors found."""
+        from xml.etree.ElementTree import XML
+
         xml = await response.text()
         root = XML(xml)
         tags = [element.tag for element in root]
@@ -3271,9 +3353,7 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
     ) -> ClientResponse:
         with file.open("rb") as media:
             upload_data["file"] = media
-            return await self._reddit._core._requestor._http.post(
-                upload_url, data=upload_data
-            )
+            return await self._reddit._http.post(upload_url, data=upload_data)
 
     async def _submit_media(
         self, *, data: dict[Any, Any], timeout: int, without_websockets: bool
@@ -3289,11 +3369,11 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
         if websocket_url is None or without_websockets:
             return None
         try:
-            async with self._reddit._core._requestor._http.ws_connect(
+            async with self._reddit._http.ws_connect(
                 websocket_url, timeout=timeout
             ) as websocket:
                 try:
-                    ws_update = await websocket.receive_json()
+                    ws_update = await websocket.receive_json(loads=loads)
                 except (
                     OSError,
                     BlockingIOError,
@@ -3316,6 +3396,26 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
         url = ws_update["payload"]["redirect"]
         return await self._reddit.submission(url=url)
 
+    async def _upload_all_inline_media(
+        self, inline_media: dict[str, asyncpraw.models.InlineMedia]
+    ) -> dict[str, asyncpraw.models.InlineMedia]:
+        """Upload several pieces of inline media concurrently.
+
+        :param inline_media: A dict mapping placeholder names to :class:`.InlineMedia`
+            objects to validate and upload.
+
+        :returns: A dict mapping the same placeholder names to the uploaded
+            :class:`.InlineMedia` objects.
+
+        """
+        uploaded = await self._reddit._gather_uploads(
+            *(
+                partial(self._upload_inline_media, media)
+                for media in inline_media.values()
+            )
+        )
+        return dict(zip(inline_media, uploaded))
+
     async def _upload_inline_media(self, inline_media: asyncpraw.models.InlineMedia):
         """Upload media for use in self posts and return ``inline_media``.
 
@@ -3347,31 +3447,11 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             finished, or it can be ignored.
 
         """
-        if media_path is None:
-            file = Path(__file__).absolute()
-            media_path = file.parent.parent.parent / "images" / "PRAW logo.png"
-        else:
-            file = Path(media_path)
-
-        file_name = file.name.lower()
-        file_extension = file_name.rpartition(".")[2]
-        mime_type = {
-            "png": "image/png",
-            "mov": "video/quicktime",
-            "mp4": "video/mp4",
-            "jpg": "image/jpeg",
-            "jpeg": "image/jpeg",
-            "gif": "image/gif",
-        }.get(
-            file_extension, "image/jpeg"
-        )  # default to JPEG
-        if (
-            expected_mime_prefix is not None
-            and mime_type.partition("/")[0] != expected_mime_prefix
-        ):
-            msg = f"Expected a mimetype starting with {expected_mime_prefix!r} but got mimetype {mime_type!r} (from file extension {file_extension!r})."
-            raise ClientException(msg)
-        img_data = {"filepath": file_name, "mimetype": mime_type}
+        file = _DEFAULT_UPLOAD_FILE if media_path is None else Path(media_path)
+        mime_type = self._media_mime_type(
+            expected_mime_prefix=expected_mime_prefix, file=file
+        )
+        img_data = {"filepath": file.name, "mimetype": mime_type}
 
         url = API_PATH["media_asset"]
         # until we learn otherwise, assume this request always succeeds
@@ -3426,10 +3506,27 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             post_requirements = await subreddit.post_requirements
             print(post_requirements)
 
+        .. note::
+
+            When the ``cache_ttl`` configuration option is set, the requirements for
+            each subreddit are reused for that many seconds before being requested
+            again.
+
         """
-        return await self._reddit.get(
+        cache_ttl = self._reddit.config.cache_ttl
+        cache_key = self.display_name.lower()
+        if cache_ttl:
+            cached = self._reddit._post_requirements_cache.get(cache_key)
+            if cached is not None and monotonic() - cached[0] < cache_ttl:
+                return deepcopy(cached[1])
+        requirements = await self._reddit.get(
             API_PATH["post_requirements"].format(subreddit=str(self))
         )
+        if cache_ttl:
+            self._reddit._cache_store(
+                self._reddit._post_requirements_cache, cache_key, requirements
+            )
+        return requirements
 
     async def random(self) -> asyncpraw.models.Submission | None:
         """Return a random :class:`.Submission`.
@@ -3503,13 +3600,17 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             syntax=syntax,
             t=time_filter,
         )
-        url = API_PATH["search"].format(subreddit=self)
-        return ListingGenerator(self._reddit, url, **generator_kwargs)
+        return ListingGenerator(self._reddit, self._search_url, **generator_kwargs)
 
     @_deprecate_args("number")
-    async def sticky(self, *, number: int = 1) -> asyncpraw.models.Submission:
+    async def sticky(
+        self, *, fetch: bool = True, number: int = 1
+    ) -> asyncpraw.models.Submission:
         """Return a :class:`.Submission` object for a sticky of the subreddit.
 
+        :param fetch: Determines if Async PRAW will fetch the object (default:
+            ``True``). When ``False``, only the submission's ID is known, which saves a
+            request when other attributes are not needed.
         :param number: Specify which sticky to return. 1 appears at the top (default:
             ``1``).
 
@@ -3523,15 +3624,15 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             await subreddit.sticky()
 
         """
-        url = API_PATH["about_sticky"].format(subreddit=self)
         try:
-            await self._reddit.get(url, params={"num": number})
+            await self._reddit.get(self._sticky_url, params={"num": number})
         except Redirect as redirect:
             path = redirect.path
         submission = self._submission_class(
             self._reddit, url=urljoin(self._reddit.config.reddit_url, path)
         )
-        await submission._fetch()
+        if fetch:
+            await submission._fetch()
         return submission
 
     @_deprecate_args(
@@ -3660,7 +3761,7 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             - :meth:`~.Subreddit.submit_video` to submit videos and videogifs
 
         """
-        if (bool(selftext) or selftext == "") == bool(url):
+        if (selftext is None) == (not url):
             msg = "Either 'selftext' or 'url' must be provided."
             raise TypeError(msg)
 
@@ -3673,23 +3774,19 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             "spoiler": bool(spoiler),
             "validate_on_submit": self._reddit.validate_on_submit,
         }
-        for key, value in (
-            ("flair_id", flair_id),
-            ("flair_text", flair_text),
-            ("collection_id", collection_id),
-            ("discussion_type", discussion_type),
-            ("draft_id", draft_id),
-        ):
-            if value is not None:
-                data[key] = value
+        self._add_optional_fields(
+            data,
+            flair_id=flair_id,
+            flair_text=flair_text,
+            collection_id=collection_id,
+            discussion_type=discussion_type,
+            draft_id=draft_id,
+        )
         if selftext is not None:
             data.update(kind="self")
             if inline_media:
                 body = selftext.format(
-                    **{
-                        placeholder: await self._upload_inline_media(media)
-                        for placeholder, media in inline_media.items()
-                    }
+                    **await self._upload_all_inline_media(inline_media)
                 )
                 converted = await self._convert_to_fancypants(body)
                 data.update(richtext_json=dumps(converted))
@@ -3781,6 +3878,11 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
 
         """
         self._validate_gallery(images)
+        # check every image's type before any upload starts
+        for image in images:
+            self._media_mime_type(
+                expected_mime_prefix="image", file=Path(image["image_path"])
+            )
         data = {
             "api_type": "json",
             "items": [],
@@ -3792,26 +3894,30 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             "title": title,
             "validate_on_submit": self._reddit.validate_on_submit,
         }
-        for key, value in (
-            ("flair_id", flair_id),
-            ("flair_text", flair_text),
-            ("collection_id", collection_id),
-            ("discussion_type", discussion_type),
-        ):
-            if value is not None:
-                data[key] = value
-        for image in images:
+        self._add_optional_fields(
+            data,
+            flair_id=flair_id,
+            flair_text=flair_text,
+            collection_id=collection_id,
+            discussion_type=discussion_type,
+        )
+        media_ids = await self._reddit._gather_uploads(
+            *(
+                partial(
+                    self._upload_media,
+                    expected_mime_prefix="image",
+                    media_path=image["image_path"],
+                    upload_type="gallery",
+                )
+                for image in images
+            )
+        )
+        for image, media_id in zip(images, media_ids):
             data["items"].append(
                 {
                     "caption": image.get("caption", ""),
                     "outbound_url": image.get("outbound_url", ""),
-                    "media_id": (
-                        await self._upload_media(
-                            expected_mime_prefix="image",
-                            media_path=image["image_path"],
-                            upload_type="gallery",
-                        )
-                    )[0],
+                    "media_id": media_id,
                 }
             )
         response = await self._reddit.request(
@@ -3923,14 +4029,13 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             "spoiler": bool(spoiler),
             "validate_on_submit": self._reddit.validate_on_submit,
         }
-        for key, value in (
-            ("flair_id", flair_id),
-            ("flair_text", flair_text),
-            ("collection_id", collection_id),
-            ("discussion_type", discussion_type),
-        ):
-            if value is not None:
-                data[key] = value
+        self._add_optional_fields(
+            data,
+            flair_id=flair_id,
+            flair_text=flair_text,
+            collection_id=collection_id,
+            discussion_type=discussion_type,
+        )
 
         image_url = await self._upload_media(
             expected_mime_prefix="image", media_path=image_path
@@ -4025,14 +4130,13 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             "spoiler": bool(spoiler),
             "validate_on_submit": self._reddit.validate_on_submit,
         }
-        for key, value in (
-            ("flair_id", flair_id),
-            ("flair_text", flair_text),
-            ("collection_id", collection_id),
-            ("discussion_type", discussion_type),
-        ):
-            if value is not None:
-                data[key] = value
+        self._add_optional_fields(
+            data,
+            flair_id=flair_id,
+            flair_text=flair_text,
+            collection_id=collection_id,
+            discussion_type=discussion_type,
+        )
 
         return await self._reddit.post(API_PATH["submit_poll_post"], json=data)
 
@@ -4146,19 +4250,22 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             "spoiler": bool(spoiler),
             "validate_on_submit": self._reddit.validate_on_submit,
         }
-        for key, value in (
-            ("flair_id", flair_id),
-            ("flair_text", flair_text),
-            ("collection_id", collection_id),
-            ("discussion_type", discussion_type),
-        ):
-            if value is not None:
-                data[key] = value
+        self._add_optional_fields(
+            data,
+            flair_id=flair_id,
+            flair_text=flair_text,
+            collection_id=collection_id,
+            discussion_type=discussion_type,
+        )
 
-        video_url = await self._upload_media(
-            expected_mime_prefix="video", media_path=video_path
+        # check the video's type before either upload starts
+        self._media_mime_type(expected_mime_prefix="video", file=Path(video_path))
+        video_url, video_poster_url = await self._reddit._gather_uploads(
+            partial(
+                self._upload_media, expected_mime_prefix="video", media_path=video_path
+            ),
+            partial(self._upload_media, media_path=thumbnail_path),
         )
-        video_poster_url = await self._upload_media(media_path=thumbnail_path)
         data.update(
             kind="videogif" if videogif else "video",
             url=video_url,
@@ -4185,6 +4292,15 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             subreddit = await reddit.subreddit("test")
             await subreddit.subscribe()
 
+        To subscribe to several subreddits with a single request, rather than awaiting
+        :meth:`.subscribe` once per subreddit:
+
+        .. code-block:: python
+
+            subreddit = await reddit.subreddit("test")
+            others = [await reddit.subreddit(name) for name in ["redditdev", "python"]]
+            await subreddit.subscribe(other_subreddits=others)
+
         """
         data = {
             "action": "sub",
@@ -4240,6 +4356,14 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             subreddit = await reddit.subreddit("test")
             await subreddit.unsubscribe()
 
+        To unsubscribe from several subreddits with a single request:
+
+        .. code-block:: python
+
+            subreddit = await reddit.subreddit("test")
+            others = [await reddit.subreddit(name) for name in ["redditdev", "python"]]
+            await subreddit.unsubscribe(other_subreddits=others)
+
         """
         data = {
             "action": "unsub",
@@ -4256,6 +4380,14 @@ WidgetEncoder._subreddit_class = Subreddit
 class SubredditLinkFlairTemplates(SubredditFlairTemplates):
     """Provide functions to interact with link flair templates."""
 
+    @cachedproperty
+    def _flairselector_url(self) -> str:
+        return API_PATH["flairselector"].format(subreddit=self.subreddit)
+
+    @cachedproperty
+    def _link_flair_url(self) -> str:
+        return API_PATH["link_flair"].format(subreddit=self.subreddit)
+
     async def __aiter__(
         self,
     ) -> AsyncGenerator[dict[str, str | int | bool | list[dict[str, str]]], None]:
@@ -4270,9 +4402,8 @@ class SubredditLinkFlairTemplates(SubredditFlairTemplates):
                 print(template)
 
         """
-        url = API_PATH["link_flair"].format(subreddit=self.subreddit)
-        results = await self.subreddit._reddit.get(url)
-        for template in results:
+        results = await self.subreddit._reddit.get(self._link_flair_url)
+        async for template in self._iterate_templates(results):
             yield template
 
     @_deprecate_args(
@@ -4381,17 +4512,38 @@ class SubredditLinkFlairTemplates(SubredditFlairTemplates):
             async for template in subreddit.flair.link_templates.user_selectable():
                 print(template)
 
+        .. note::
+
+            When the ``cache_ttl`` configuration option is set, the templates for each
+            subreddit are reused for that many seconds before being requested again.
+            Adding, updating, deleting, clearing, or reordering templates through this
+            :class:`.Reddit` instance discards them early.
+
         """
-        url = API_PATH["flairselector"].format(subreddit=self.subreddit)
-        for template in (
-            await self.subreddit._reddit.post(url, data={"is_newlink": True})
-        )["choices"]:
+        reddit = self.subreddit._reddit
+        cache_ttl = reddit.config.cache_ttl
+        cache_key = self.subreddit.display_name.lower()
+        cached = reddit._user_selectable_cache.get(cache_key) if cache_ttl else None
+        if cached is not None and monotonic() - cached[0] < cache_ttl:
+            choices = deepcopy(cached[1])
+        else:
+            response = await reddit.post(
+                self._flairselector_url, data={"is_newlink": True}
+            )
+            choices = response["choices"]
+            if cache_ttl:
+                reddit._cache_store(reddit._user_selectable_cache, cache_key, choices)
+        for template in choices:
             yield template
 
 
 class SubredditRedditorFlairTemplates(SubredditFlairTemplates):
     """Provide functions to interact with :class:`.Redditor` flair templates."""
 
+    @cachedproperty
+    def _user_flair_url(self) -> str:
+        return API_PATH["user_flair"].format(subreddit=self.subreddit)
+
     async def __aiter__(
         self,
     ) -> AsyncGenerator[dict[str, str | int | bool | list[dict[str, str]]], None]:
@@ -4406,10 +4558,9 @@ class SubredditRedditorFlairTemplates(SubredditFlairTemplates):
                 print(template)
 
         """
-        url = API_PATH["user_flair"].format(subreddit=self.subreddit)
         params = {"unique": self.subreddit._reddit._next_unique}
-        results = await self.subreddit._reddit.get(url, params=params)
-        for template in results:
+        results = await self.subreddit._reddit.get(self._user_flair_url, params=params)
+        async for template in self._iterate_templates(results):
             yield template
 
     @_deprecate_args(
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from json import JSONEncoder, dumps
+from functools import partial
+from json import JSONEncoder
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from ...const import API_PATH
-from ...util import _deprecate_args
+from ...util import _deprecate_args, json_utils
 from ...util.cache import cachedproperty
 from ..base import AsyncPRAWBase
 from ..list.base import BaseList
@@ -259,6 +260,10 @@ class SubredditWidgets(AsyncPRAWBase):
 
     """
 
+    @cachedproperty
+    def _widgets_url(self) -> str:
+        return API_PATH["widgets"].format(subreddit=self.subreddit)
+
     @cachedproperty
     def mod(self) -> asyncpraw.models.SubredditWidgetsModeration:
         """Get an instance of :class:`.SubredditWidgetsModeration`.
@@ -274,11 +279,10 @@ class SubredditWidgets(AsyncPRAWBase):
 
     def __getattr__(self, attr: str) -> Any:
         """Return the value of ``attr``."""
+        msg = f"{self.__class__.__name__!r} object has no attribute {attr!r}"
         if not attr.startswith("_") and not self._fetched:
-            msg = f"{self.__class__.__name__!r} object has no attribute {attr!r}, did you forget to run '.refresh()'?"
-            raise AttributeError(msg)
-        msg = f"{self.__class__.__name__!r} object has no attribute {attr!r}, did you forget to run '.refresh()'?"  # pragma: no cover
-        raise AttributeError(msg)  # pragma: no cover
+            msg += ", did you forget to run '.refresh()'?"
+        raise AttributeError(msg)
 
     def __init__(self, subreddit: asyncpraw.models.Subreddit):
         """Initialize a :class:`.SubredditWidgets` instance.
@@ -286,7 +290,6 @@ class SubredditWidgets(AsyncPRAWBase):
         :param subreddit: The :class:`.Subreddit` the widgets belong to.
 
         """
-        self._raw_items = None
         self._items = None
         self._fetched = False
         self.subreddit = subreddit
@@ -300,14 +303,20 @@ class SubredditWidgets(AsyncPRAWBase):
 
     async def _fetch(self):
         data = await self._reddit.get(
-            API_PATH["widgets"].format(subreddit=self.subreddit),
-            params={"progressive_images": self.progressive_images},
+            self._widgets_url, params={"progressive_images": self.progressive_images}
         )
 
-        self._raw_items = data.pop("items")
-        self._items = None
-        super().__init__(self.subreddit._reddit, data)
+        raw_items = data.pop("items")
+        self.__dict__.update(data)
 
+        subreddit = self.subreddit
+        for item_data in raw_items.values():
+            item_data["subreddit"] = subreddit
+        objectify = self._reddit._objector.objectify
+        self._items = {
+            item_name: objectify(item_data)
+            for item_name, item_data in raw_items.items()
+        }
         self._fetched = True
 
     async def id_card(self) -> asyncpraw.models.IDCard:
@@ -317,13 +326,8 @@ class SubredditWidgets(AsyncPRAWBase):
 
     async def items(self) -> dict[str, asyncpraw.models.Widget]:
         """Get this :class:`.Subreddit`'s widgets as a dict from ID to widget."""
-        if self._items is None:
-            if not self._raw_items:
-                await self._fetch()
-            self._items = {}
-            for item_name, data in self._raw_items.items():
-                data["subreddit"] = self.subreddit
-                self._items[item_name] = self._reddit._objector.objectify(data)
+        if not self._fetched:
+            await self._fetch()
         return self._items
 
     async def moderators_widget(self) -> asyncpraw.models.ModeratorsWidget:
@@ -364,6 +368,10 @@ class SubredditWidgets(AsyncPRAWBase):
 class Widget(AsyncPRAWBase):
     """Base class to represent a :class:`.Widget`."""
 
+    @cachedproperty
+    def _id_lower(self) -> str:
+        return self.id.lower()
+
     @cachedproperty
     def mod(self) -> asyncpraw.models.WidgetModeration:
         """Get an instance of :class:`.WidgetModeration` for this widget.
@@ -380,8 +388,12 @@ class Widget(AsyncPRAWBase):
     def __eq__(self, other: object) -> bool:
         """Check equality against another object."""
         if isinstance(other, Widget):
-            return self.id.lower() == other.id.lower()
-        return str(other).lower() == self.id.lower()
+            return self._id_lower == other._id_lower
+        return str(other).lower() == self._id_lower
+
+    def __hash__(self) -> int:
+        """Return the hash of the current instance."""
+        return hash(self._id_lower)
 
     def __init__(self, reddit: asyncpraw.Reddit, _data: dict[str, Any]):
         """Initialize a :class:`.Widget` instance."""
@@ -403,6 +415,9 @@ class WidgetEncoder(JSONEncoder):
         return JSONEncoder.default(self, o)
 
 
+_WIDGET_ENCODER = WidgetEncoder()
+
+
 class ButtonWidget(Widget, BaseList):
     r"""Class to represent a widget containing one or more buttons.
 
@@ -786,14 +801,10 @@ class ImageWidget(Widget, BaseList):
         subreddit = await reddit.subreddit("test")
         widgets = subreddit.widgets
         image_paths = ["/path/to/image1.jpg", "/path/to/image2.png"]
+        image_urls = await widgets.mod.upload_images(image_paths)
         image_data = [
-            {
-                "width": 600,
-                "height": 450,
-                "linkUrl": "",
-                "url": await widgets.mod.upload_image(img_path),
-            }
-            for img_path in image_paths
+            {"width": 600, "height": 450, "linkUrl": "", "url": image_url}
+            for image_url in image_urls
         ]
         styles = {"backgroundColor": "#FFFF66", "headerColor": "#3333EE"}
         image_widget = await widgets.mod.add_image_widget(
@@ -948,9 +959,8 @@ class ModeratorsWidget(Widget, BaseList):
 
     def __init__(self, reddit: asyncpraw.Reddit, _data: dict[str, Any]):
         """Initialize a :class:`.ModeratorsWidget` instance."""
-        if self.CHILD_ATTRIBUTE not in _data:
-            # .mod.update() sometimes returns payload without "mods" field
-            _data[self.CHILD_ATTRIBUTE] = []
+        # .mod.update() sometimes returns payload without "mods" field
+        _data.setdefault(self.CHILD_ATTRIBUTE, [])
         super().__init__(reddit, _data=_data)
 
 
@@ -1068,9 +1078,8 @@ class RulesWidget(Widget, BaseList):
 
     def __init__(self, reddit: asyncpraw.Reddit, _data: dict[str, Any]):
         """Initialize a :class:`.RulesWidget` instance."""
-        if self.CHILD_ATTRIBUTE not in _data:
-            # .mod.update() sometimes returns payload without "data" field
-            _data[self.CHILD_ATTRIBUTE] = []
+        # .mod.update() sometimes returns payload without "data" field
+        _data.setdefault(self.CHILD_ATTRIBUTE, [])
         super().__init__(reddit, _data=_data)
 
 
@@ -1148,6 +1157,12 @@ class WidgetModeration:
 
     """
 
+    @cachedproperty
+    def _widget_modify_url(self) -> str:
+        return API_PATH["widget_modify"].format(
+            widget_id=self.widget.id, subreddit=self._subreddit
+        )
+
     def __init__(
         self,
         widget: asyncpraw.models.Widget,
@@ -1169,10 +1184,7 @@ class WidgetModeration:
             await widget.mod.delete()
 
         """
-        path = API_PATH["widget_modify"].format(
-            widget_id=self.widget.id, subreddit=self._subreddit
-        )
-        await self._reddit.delete(path)
+        await self._reddit.delete(self._widget_modify_url)
 
     async def update(self, **kwargs: Any) -> Widget:
         """Update the widget. Returns the updated widget.
@@ -1195,20 +1207,16 @@ class WidgetModeration:
             check the Reddit documentation linked above.
 
         """
-        path = API_PATH["widget_modify"].format(
-            widget_id=self.widget.id, subreddit=self._subreddit
-        )
         payload = {
             key: value
             for key, value in vars(self.widget).items()
-            if not key.startswith("_")
+            # subreddit is not JSON serializable and mod is a helper, not widget data
+            if not key.startswith("_") and key not in {"mod", "subreddit"}
         }
-        del payload["subreddit"]  # not JSON serializable
-        if "mod" in payload:
-            del payload["mod"]
         payload.update(kwargs)
         widget = await self._reddit.put(
-            path, data={"json": dumps(payload, cls=WidgetEncoder)}
+            self._widget_modify_url,
+            data={"json": json_utils.dumps(payload, default=_WIDGET_ENCODER.default)},
         )
         widget.subreddit = self._subreddit
         return widget
@@ -1236,15 +1244,29 @@ class SubredditWidgetsModeration:
 
     """
 
+    @staticmethod
+    def _validate_short_name(short_name: str):
+        if len(short_name) > 30:
+            msg = "'short_name' must be 30 characters or less."
+            raise ValueError(msg)
+
+    @cachedproperty
+    def _widget_create_url(self) -> str:
+        return API_PATH["widget_create"].format(subreddit=self._subreddit)
+
+    @cachedproperty
+    def _widget_lease_url(self) -> str:
+        return API_PATH["widget_lease"].format(subreddit=self._subreddit)
+
     def __init__(self, subreddit: asyncpraw.models.Subreddit, reddit: asyncpraw.Reddit):
         """Initialize a :class:`.SubredditWidgetsModeration` instance."""
         self._subreddit = subreddit
         self._reddit = reddit
 
     async def _create_widget(self, payload: dict[str, Any]) -> WidgetType:
-        path = API_PATH["widget_create"].format(subreddit=self._subreddit)
         widget = await self._reddit.post(
-            path, data={"json": dumps(payload, cls=WidgetEncoder)}
+            self._widget_create_url,
+            data={"json": json_utils.dumps(payload, default=_WIDGET_ENCODER.default)},
         )
         widget.subreddit = self._subreddit
         return widget
@@ -1380,14 +1402,15 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         button_widget = {
             "buttons": buttons,
             "description": description,
             "kind": "button",
             "shortName": short_name,
             "styles": styles,
+            **other_settings,
         }
-        button_widget.update(other_settings)
         return await self._create_widget(button_widget)
 
     @_deprecate_args(
@@ -1455,6 +1478,7 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         calendar = {
             "shortName": short_name,
             "googleCalendarId": google_calendar_id,
@@ -1462,8 +1486,8 @@ class SubredditWidgetsModeration:
             "configuration": configuration,
             "styles": styles,
             "kind": "calendar",
+            **other_settings,
         }
-        calendar.update(other_settings)
         return await self._create_widget(calendar)
 
     @_deprecate_args("short_name", "data", "styles", "description")
@@ -1502,14 +1526,15 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         community_list = {
-            "data": data,
+            "data": [str(subreddit) for subreddit in data],
             "kind": "community-list",
             "shortName": short_name,
             "styles": styles,
             "description": description,
+            **other_settings,
         }
-        community_list.update(other_settings)
         return await self._create_widget(community_list)
 
     @_deprecate_args("short_name", "text", "css", "height", "image_data", "styles")
@@ -1576,7 +1601,7 @@ class SubredditWidgetsModeration:
             subreddit = await reddit.subreddit("test")
             widget_moderation = subreddit.widgets.mod
             image_paths = ["/path/to/image1.jpg", "/path/to/image2.png"]
-            image_urls = [widget_moderation.upload_image(img_path) for img_path in image_paths]
+            image_urls = await widget_moderation.upload_images(image_paths)
             image_data = [
                 {"width": 600, "height": 450, "name": "logo", "url": image_urls[0]},
                 {"width": 450, "height": 600, "name": "icon", "url": image_urls[1]},
@@ -1592,6 +1617,13 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
+        if len(css) > 100000:
+            msg = "'css' must be 100000 characters or less."
+            raise ValueError(msg)
+        if not 50 <= height <= 500:
+            msg = "'height' must be between 50 and 500."
+            raise ValueError(msg)
         custom_widget = {
             "css": css,
             "height": height,
@@ -1600,8 +1632,8 @@ class SubredditWidgetsModeration:
             "shortName": short_name,
             "styles": styles,
             "text": text,
+            **other_settings,
         }
-        custom_widget.update(other_settings)
         return await self._create_widget(custom_widget)
 
     @_deprecate_args("short_name", "data", "styles")
@@ -1654,14 +1686,10 @@ class SubredditWidgetsModeration:
             subreddit = await reddit.subreddit("test")
             widget_moderation = subreddit.widgets.mod
             image_paths = ["/path/to/image1.jpg", "/path/to/image2.png"]
+            image_urls = await widget_moderation.upload_images(image_paths)
             image_data = [
-                {
-                    "width": 600,
-                    "height": 450,
-                    "linkUrl": "",
-                    "url": widget_moderation.upload_image(img_path),
-                }
-                for img_path in image_paths
+                {"width": 600, "height": 450, "linkUrl": "", "url": image_url}
+                for image_url in image_urls
             ]
             styles = {"backgroundColor": "#FFFF66", "headerColor": "#3333EE"}
             new_widget = await widget_moderation.add_image_widget(
@@ -1669,13 +1697,14 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         image_widget = {
             "data": data,
             "kind": "image",
             "shortName": short_name,
             "styles": styles,
+            **other_settings,
         }
-        image_widget.update(other_settings)
         return await self._create_widget(image_widget)
 
     @_deprecate_args("data")
@@ -1738,8 +1767,7 @@ class SubredditWidgetsModeration:
             new_widget = await widget_moderation.add_menu(data=menu_contents)
 
         """
-        menu = {"data": data, "kind": "menu"}
-        menu.update(other_settings)
+        menu = {"data": data, "kind": "menu", **other_settings}
         return await self._create_widget(menu)
 
     @_deprecate_args("short_name", "display", "order", "styles")
@@ -1782,14 +1810,15 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         post_flair = {
             "kind": "post-flair",
             "display": display,
             "shortName": short_name,
             "order": order,
             "styles": styles,
+            **other_settings,
         }
-        post_flair.update(other_settings)
         return await self._create_widget(post_flair)
 
     @_deprecate_args("short_name", "text", "styles")
@@ -1823,13 +1852,14 @@ class SubredditWidgetsModeration:
             )
 
         """
+        self._validate_short_name(short_name)
         text_area = {
             "shortName": short_name,
             "text": text,
             "styles": styles,
             "kind": "textarea",
+            **other_settings,
         }
-        text_area.update(other_settings)
         return await self._create_widget(text_area)
 
     @_deprecate_args("new_order", "section")
@@ -1858,7 +1888,9 @@ class SubredditWidgetsModeration:
         path = API_PATH["widget_order"].format(
             subreddit=self._subreddit, section=section
         )
-        await self._reddit.patch(path, data={"json": dumps(order), "section": section})
+        await self._reddit.patch(
+            path, data={"json": json_utils.dumps(order), "section": section}
+        )
 
     async def upload_image(self, file_path: str) -> str:
         """Upload an image to Reddit and get the URL.
@@ -1885,26 +1917,49 @@ class SubredditWidgetsModeration:
 
         """
         file = Path(file_path)
-        img_data = {
-            "filepath": file.name,
-            "mimetype": "image/jpeg",
-        }
-        if file_path.lower().endswith(".png"):
-            img_data["mimetype"] = "image/png"
+        mime_type = {
+            "gif": "image/gif",
+            "png": "image/png",
+        }.get(file.suffix[1:].lower(), "image/jpeg")
+        img_data = {"filepath": file.name, "mimetype": mime_type}
 
-        url = API_PATH["widget_lease"].format(subreddit=self._subreddit)
         # until we learn otherwise, assume this request always succeeds
-        response = await self._reddit.post(url, data=img_data)
+        response = await self._reddit.post(self._widget_lease_url, data=img_data)
         upload_lease = response["s3UploadLease"]
         upload_data = {item["name"]: item["value"] for item in upload_lease["fields"]}
-        upload_url = f"https:{upload_lease['action']}"
+        upload_url = f"https:{upload_lease['action']}".rstrip("/")
 
         # TODO(@LilSpazJoekp): This is a blocking operation. It should be made async.
         with file.open("rb") as image:  # noqa: ASYNC230
             upload_data["file"] = image
-            response = await self._reddit._core._requestor._http.post(
+            async with self._reddit._http.post(
                 upload_url, data=upload_data
-            )
-        response.raise_for_status()
+            ) as response:
+                response.raise_for_status()
 
         return f"{upload_url}/{upload_data['key']}"
+
+    async def upload_images(self, file_paths: list[str]) -> list[str]:
+        """Upload several images to Reddit concurrently and get their URLs.
+
+        :param file_paths: A list of paths to local files.
+
+        :returns: A list of the URLs of the uploaded images, in the same order as
+            ``file_paths``.
+
+        The number of uploads in progress at once is limited by the
+        ``max_concurrent_uploads`` configuration option. If any upload fails, the
+        remaining uploads are cancelled and the exception is raised.
+
+        Example usage:
+
+        .. code-block:: python
+
+            my_sub = await reddit.subreddit("test")
+            image_paths = ["/path/to/image1.jpg", "/path/to/image2.png"]
+            image_urls = await my_sub.widgets.mod.upload_images(image_paths)
+
+        """
+        return await self._reddit._gather_uploads(
+            *(partial(self.upload_image, file_path) for file_path in file_paths)
+        )
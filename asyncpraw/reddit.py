@@ -6,14 +6,17 @@ import asyncio
 import configparser
 import os
 import re
-from copy import copy
+from copy import copy, deepcopy
 from itertools import islice
 from logging import getLogger
+from time import monotonic
 from typing import (
     IO,
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Awaitable,
+    Callable,
     Iterable,
 )
 from urllib.parse import urlparse
@@ -42,7 +45,7 @@ from .exceptions import (
 )
 from .models.util import deprecate_lazy
 from .objector import Objector
-from .util import _deprecate_args
+from .util import _deprecate_args, cachedproperty
 
 try:
     from update_checker import update_check
@@ -96,6 +99,10 @@ class Reddit:
         self._unique_counter += 1
         return value
 
+    @cachedproperty
+    def _upload_semaphore(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.config.max_concurrent_uploads)
+
     @property
     def read_only(self) -> bool:
         """Return ``True`` when using the ``ReadOnlyAuthorizer``."""
@@ -285,8 +292,10 @@ class Reddit:
         """
         self._core = self._authorized_core = self._read_only_core = None
         self._objector = None
+        self._post_requirements_cache = {}
         self._token_manager = token_manager
         self._unique_counter = 0
+        self._user_selectable_cache = {}
         self._validate_on_submit = False
 
         try:
@@ -326,6 +335,7 @@ class Reddit:
         self.requestor = self._prepare_asyncprawcore(
             requestor_class=requestor_class, requestor_kwargs=requestor_kwargs
         )
+        self._http = self.requestor._http
 
         self.auth = models.Auth(self, None)
         """An instance of :class:`.Auth`.
@@ -519,6 +529,23 @@ class Reddit:
 
         """
 
+    def _cache_store(self, cache: dict[str, tuple[float, Any]], key: str, value: Any):
+        """Store a copy of ``value`` in ``cache`` and discard expired entries.
+
+        Expired entries are only replaced when their key is stored again, so they are
+        pruned here to keep ``cache`` from growing with every subreddit requested.
+
+        """
+        now = monotonic()
+        ttl = self.config.cache_ttl
+        for expired in [
+            cached_key
+            for cached_key, (stored, _) in cache.items()
+            if now - stored >= ttl
+        ]:
+            del cache[expired]
+        cache[key] = (now, deepcopy(value))
+
     def _check_for_update(self):
         if UPDATE_CHECKER_MISSING:
             return
@@ -526,6 +553,34 @@ class Reddit:
             update_check(__package__, __version__)
             Reddit.update_checked = True
 
+    async def _gather_uploads(
+        self, *uploads: Callable[[], Awaitable[Any]]
+    ) -> list[Any]:
+        """Run ``uploads`` concurrently and return their results in order.
+
+        Each upload is a callable taking no arguments that returns the awaitable to
+        run. It is only called once the upload may start, so uploads that are cancelled
+        before then never create their awaitable.
+
+        The number of uploads in progress across this instance is limited by the
+        ``max_concurrent_uploads`` configuration option. If any upload fails, the
+        remaining uploads are cancelled and the exception is raised.
+
+        """
+        semaphore = self._upload_semaphore
+
+        async def bounded(upload: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await upload()
+
+        tasks = [asyncio.ensure_future(bounded(upload)) for upload in uploads]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     def _handle_rate_limit(self, exception: RedditAPIException) -> int | float | None:
         for item in exception.items:
             if item.error_type == "RATELIMIT":
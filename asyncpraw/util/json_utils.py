@@ -0,0 +1,42 @@
+"""Provide JSON helpers that use :mod:`orjson` when it is installed."""
+
+from __future__ import annotations
+
+from json import dumps as _json_dumps
+from typing import Any, Callable
+
+try:
+    from orjson import (
+        OPT_NON_STR_KEYS,
+        loads,  # noqa: F401
+    )
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # pragma: no cover
+    from json import loads  # noqa: F401
+
+    _orjson_dumps = None
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize ``obj`` to a JSON formatted :py:class:`str`.
+
+    :param obj: The object to serialize.
+    :param default: A function called with objects that cannot otherwise be
+        serialized. It should return a serializable version of the object or raise
+        :py:class:`TypeError` (default: ``None``).
+
+    .. note::
+
+        With :mod:`orjson` installed the output is compact and non-finite floats
+        (``nan`` and ``inf``) are serialized as ``null``. Without it, :mod:`json`
+        separates items with a space and writes them as ``NaN`` and ``Infinity``.
+
+    """
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(obj, default=default, option=OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects some objects that json accepts, such as integers that do
+            # not fit in 64 bits
+            pass
+    return _json_dumps(obj, default=default)
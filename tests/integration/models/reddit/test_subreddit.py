@@ -1273,7 +1273,7 @@ class WebsocketMock:
         self.post_ids = post_ids
         self.i = -1
 
-    async def receive_json(self):
+    async def receive_json(self, *, loads=None):
         if not self.post_ids:
             raise WebSocketError(0, "")
         assert 0 <= self.i + 1 < len(self.post_ids)
@@ -1,7 +1,9 @@
+import asyncio
 import sys
 
 import aiohttp
 import pytest
+from asyncprawcore import Redirect
 
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
@@ -27,6 +29,16 @@ class TestSubreddit(UnitTest):
         with pytest.raises(ValueError):
             Subreddit(reddit, "")
 
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_create_or_update__drops_none(self, mock_post, reddit):
+        await Subreddit._create_or_update(
+            _reddit=reddit, header_hover_text="hover", name="test", custom="value"
+        )
+        mock_post.assert_awaited_once_with(
+            "api/site_admin/",
+            data={"header-title": "hover", "name": "test", "custom": "value"},
+        )
+
     def test_equality(self, reddit):
         subreddit1 = Subreddit(reddit, _data={"display_name": "dummy1", "n": 1})
         subreddit2 = Subreddit(reddit, _data={"display_name": "Dummy1", "n": 2})
@@ -108,6 +120,26 @@ class TestSubreddit(UnitTest):
                 "Test", "/dev/null"
             )
 
+    @mock.patch(
+        "asyncpraw.Reddit.post",
+        new_callable=AsyncMock,
+        return_value={
+            "args": {"action": "//dummy", "fields": [{"name": "key", "value": "k"}]}
+        },
+    )
+    @mock.patch("asyncpraw.models.Subreddit._read_and_post_media")
+    async def test_media_upload__default_file(self, mock_method, mock_post, reddit):
+        mock_method.return_value = MagicMock(status=201)
+        url = await Subreddit(reddit, display_name="test")._upload_media(
+            media_path=None
+        )
+        assert url == "https://dummy/k"
+        mock_post.assert_awaited_once_with(
+            "api/media/asset.json",
+            data={"filepath": "PRAW logo.png", "mimetype": "image/png"},
+        )
+        assert mock_method.call_args[0][0].is_file()
+
     async def test_notes_delete__invalid_args(self):
         with pytest.raises(TypeError) as excinfo:
             await Subreddit(None, "SubTestBot1").mod.notes.delete(note_id="111")
@@ -116,6 +148,44 @@ class TestSubreddit(UnitTest):
             " called from a Redditor instance (e.g., 'redditor.notes')."
         )
 
+    @mock.patch(
+        "asyncpraw.Reddit.get",
+        new_callable=AsyncMock,
+        return_value={"is_flair_required": False},
+    )
+    async def test_post_requirements__cached(self, mock_get, reddit):
+        reddit.config.cache_ttl = 60
+        subreddit = Subreddit(reddit, display_name="Test")
+        assert await subreddit.post_requirements() == {"is_flair_required": False}
+        assert await Subreddit(reddit, display_name="test").post_requirements() == {
+            "is_flair_required": False
+        }
+        mock_get.assert_awaited_once()
+
+    @mock.patch(
+        "asyncpraw.Reddit.get",
+        new_callable=AsyncMock,
+        return_value={"is_flair_required": False},
+    )
+    async def test_post_requirements__expired_pruned(self, _, reddit):
+        reddit.config.cache_ttl = 60
+        with mock.patch("asyncpraw.reddit.monotonic", return_value=0):
+            await Subreddit(reddit, display_name="first").post_requirements()
+        with mock.patch("asyncpraw.reddit.monotonic", return_value=60):
+            await Subreddit(reddit, display_name="second").post_requirements()
+        assert list(reddit._post_requirements_cache) == ["second"]
+
+    @mock.patch(
+        "asyncpraw.Reddit.get",
+        new_callable=AsyncMock,
+        return_value={"is_flair_required": False},
+    )
+    async def test_post_requirements__not_cached(self, mock_get, reddit):
+        subreddit = Subreddit(reddit, display_name="test")
+        await subreddit.post_requirements()
+        await subreddit.post_requirements()
+        assert mock_get.await_count == 2
+
     def test_repr(self, reddit):
         subreddit = Subreddit(reddit, display_name="name")
         assert repr(subreddit) == "Subreddit(display_name='name')"
@@ -127,6 +197,17 @@ class TestSubreddit(UnitTest):
         assert generator.params["dummy"] == "value"
         assert params == {"dummy": "value"}
 
+    @mock.patch("asyncpraw.Reddit.get", new_callable=AsyncMock)
+    async def test_sticky__no_fetch(self, mock_get, reddit):
+        response = MagicMock(headers={"location": "/r/test/comments/abc123/title/"})
+        mock_get.side_effect = Redirect(response)
+        subreddit = Subreddit(reddit, display_name="test")
+        with mock.patch("asyncpraw.models.Submission._fetch") as mock_fetch:
+            submission = await subreddit.sticky(fetch=False)
+        assert submission.id == "abc123"
+        assert not submission._fetched
+        mock_fetch.assert_not_called()
+
     def test_str(self, reddit):
         subreddit = Subreddit(reddit, _data={"display_name": "name", "id": "dummy"})
         assert str(subreddit) == "name"
@@ -147,6 +228,25 @@ class TestSubreddit(UnitTest):
             await subreddit.submit("Cool title", selftext="", url="b")
         assert str(excinfo.value) == message
 
+        with pytest.raises(TypeError) as excinfo:
+            await subreddit.submit("Cool title", url="")
+        assert str(excinfo.value) == message
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_submit_gallery__bad_filetype_no_request(
+        self, mock_post, image_path, reddit
+    ):
+        subreddit = Subreddit(reddit, display_name="test")
+        with pytest.raises(ClientException):
+            await subreddit.submit_gallery(
+                "Test Title",
+                [
+                    {"image_path": image_path("test.png")},
+                    {"image_path": image_path("test.mov")},
+                ],
+            )
+        mock_post.assert_not_awaited()
+
     async def test_submit_gallery__invalid_path(self, reddit):
         message = "'invalid_image_path' is not a valid image path."
         subreddit = Subreddit(reddit, display_name="name")
@@ -157,6 +257,33 @@ class TestSubreddit(UnitTest):
             )
         assert str(excinfo.value) == message
 
+    @mock.patch(
+        "asyncpraw.Reddit.request",
+        new_callable=AsyncMock,
+        return_value={"json": {"errors": [], "data": {"url": "dummy"}}},
+    )
+    @mock.patch("asyncpraw.Reddit.submission", new_callable=AsyncMock)
+    @mock.patch(
+        "asyncpraw.models.Subreddit._upload_media",
+        new_callable=AsyncMock,
+        side_effect=["asset_id_1", "asset_id_2"],
+    )
+    async def test_submit_gallery__media_ids(
+        self, _, __, mock_request, image_path, reddit
+    ):
+        subreddit = Subreddit(reddit, display_name="test")
+        await subreddit.submit_gallery(
+            "title",
+            [
+                {"image_path": image_path("test.png")},
+                {"image_path": image_path("test.jpg"), "caption": "caption"},
+            ],
+        )
+        assert mock_request.call_args.kwargs["json"]["items"] == [
+            {"caption": "", "outbound_url": "", "media_id": "asset_id_1"},
+            {"caption": "caption", "outbound_url": "", "media_id": "asset_id_2"},
+        ]
+
     async def test_submit_gallery__missing_path(self, reddit):
         message = "'image_path' is required."
         subreddit = Subreddit(reddit, display_name="name")
@@ -207,6 +334,39 @@ class TestSubreddit(UnitTest):
             with pytest.raises(ClientException):
                 await subreddit.submit_video("Test Title", video)
 
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_submit_video__bad_filetype_no_request(
+        self, mock_post, image_path, reddit
+    ):
+        subreddit = Subreddit(reddit, display_name="test")
+        with pytest.raises(ClientException):
+            await subreddit.submit_video("Test Title", image_path("test.png"))
+        mock_post.assert_not_awaited()
+
+    async def test_upload_all_inline_media__keeps_order(self, image_path, reddit):
+        first_started = asyncio.Event()
+        second_finished = asyncio.Event()
+
+        async def upload(*, media_path, upload_type):
+            if media_path.endswith("test.png"):
+                first_started.set()
+                await second_finished.wait()
+                return "first"
+            await first_started.wait()
+            second_finished.set()
+            return "second"
+
+        subreddit = Subreddit(reddit, display_name="test")
+        media = {
+            "image1": InlineImage(path=image_path("test.png")),
+            "image2": InlineImage(path=image_path("test.jpg")),
+        }
+        with mock.patch.object(subreddit, "_upload_media", new=upload):
+            uploaded = await subreddit._upload_all_inline_media(media)
+        assert list(uploaded) == ["image1", "image2"]
+        assert uploaded["image1"].media_id == "first"
+        assert uploaded["image2"].media_id == "second"
+
     async def test_upload_banner_additional_image(self, reddit):
         subreddit = Subreddit(reddit, display_name="name")
         with pytest.raises(ValueError):
@@ -225,6 +385,40 @@ class TestSubredditFlair(UnitTest):
 
 
 class TestSubredditFlairTemplates(UnitTest):
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_add__invalid_allowable_content(self, mock_post, reddit):
+        subreddit = Subreddit(reddit, pytest.placeholders.test_subreddit)
+        with pytest.raises(ValueError) as excinfo:
+            await subreddit.flair.templates.add("text", allowable_content="images")
+        assert (
+            str(excinfo.value)
+            == "'allowable_content' argument must be either 'all', 'emoji', or 'text'"
+        )
+        mock_post.assert_not_awaited()
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_add__invalid_text_color(self, mock_post, reddit):
+        subreddit = Subreddit(reddit, pytest.placeholders.test_subreddit)
+        with pytest.raises(ValueError) as excinfo:
+            await subreddit.flair.link_templates.add("text", text_color="#000000")
+        assert (
+            str(excinfo.value)
+            == "'text_color' argument must be either 'light' or 'dark'"
+        )
+        mock_post.assert_not_awaited()
+
+    @mock.patch(
+        "asyncpraw.Reddit.get",
+        new_callable=AsyncMock,
+        return_value=[{"id": str(i)} for i in range(70)],
+    )
+    @mock.patch("asyncpraw.models.reddit.subreddit.sleep", new_callable=AsyncMock)
+    async def test_iterate__yields_to_event_loop(self, mock_sleep, _, reddit):
+        subreddit = Subreddit(reddit, pytest.placeholders.test_subreddit)
+        templates = [template async for template in subreddit.flair.link_templates]
+        assert [template["id"] for template in templates] == [str(i) for i in range(70)]
+        assert mock_sleep.await_count == 2
+
     async def test_not_implemented(self, reddit):
         with pytest.raises(NotImplementedError):
             await SubredditFlairTemplates(
@@ -232,6 +426,47 @@ class TestSubredditFlairTemplates(UnitTest):
             ).__aiter__()
 
 
+class TestSubredditLinkFlairTemplates(UnitTest):
+    @mock.patch(
+        "asyncpraw.Reddit.post",
+        new_callable=AsyncMock,
+        return_value={"choices": [{"flair_template_id": "abc"}]},
+    )
+    async def test_user_selectable__cache_cleared(self, mock_post, reddit):
+        reddit.config.cache_ttl = 60
+        templates = Subreddit(reddit, display_name="test").flair.link_templates
+        _ = [template async for template in templates.user_selectable()]
+        await templates.delete("abc")
+        _ = [template async for template in templates.user_selectable()]
+        assert mock_post.await_count == 3
+
+    @mock.patch(
+        "asyncpraw.Reddit.post",
+        new_callable=AsyncMock,
+        return_value={"choices": [{"flair_template_id": "abc"}]},
+    )
+    async def test_user_selectable__cached(self, mock_post, reddit):
+        reddit.config.cache_ttl = 60
+        templates = Subreddit(reddit, display_name="Test").flair.link_templates
+        first = [template async for template in templates.user_selectable()]
+        first[0]["flair_template_id"] = "changed"
+        templates = Subreddit(reddit, display_name="test").flair.link_templates
+        second = [template async for template in templates.user_selectable()]
+        assert second == [{"flair_template_id": "abc"}]
+        mock_post.assert_awaited_once()
+
+    @mock.patch(
+        "asyncpraw.Reddit.post",
+        new_callable=AsyncMock,
+        return_value={"choices": []},
+    )
+    async def test_user_selectable__not_cached(self, mock_post, reddit):
+        templates = Subreddit(reddit, display_name="test").flair.link_templates
+        _ = [template async for template in templates.user_selectable()]
+        _ = [template async for template in templates.user_selectable()]
+        assert mock_post.await_count == 2
+
+
 class TestSubredditModmailConversationsStream(UnitTest):
     async def test_conversation_stream_capitalization(self, reddit):
         submodstream = Subreddit(reddit, display_name="Mod").mod.stream
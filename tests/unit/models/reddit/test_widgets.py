@@ -1,4 +1,6 @@
 from json import dumps
+from unittest import mock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pytest import raises
@@ -7,11 +9,13 @@ from asyncpraw.models import (
     Subreddit,
     SubredditWidgets,
     SubredditWidgetsModeration,
+    TextArea,
     Widget,
     WidgetModeration,
 )
 from asyncpraw.models.base import AsyncPRAWBase
 from asyncpraw.models.reddit.widgets import WidgetEncoder
+from asyncpraw.util.json_utils import loads
 
 from ... import UnitTest
 
@@ -20,8 +24,37 @@ class TestSubredditWidgets(UnitTest):
     async def test_bad_attribute(self, reddit):
         subreddit = await reddit.subreddit(pytest.placeholders.test_subreddit)
         widgets = subreddit.widgets
-        with pytest.raises(AttributeError):
+        with pytest.raises(AttributeError) as excinfo:
             _ = widgets.nonexistant_attribute
+        assert str(excinfo.value).endswith("did you forget to run '.refresh()'?")
+
+    def test_bad_attribute__private(self, reddit):
+        widgets = SubredditWidgets(Subreddit(reddit, "fake_subreddit"))
+        with pytest.raises(AttributeError) as excinfo:
+            _ = widgets._nonexistant_attribute
+        assert (
+            str(excinfo.value)
+            == "'SubredditWidgets' object has no attribute '_nonexistant_attribute'"
+        )
+
+    @mock.patch(
+        "asyncpraw.Reddit.get",
+        new_callable=AsyncMock,
+        return_value={
+            "items": {
+                "widget_1": {"id": "widget_1", "kind": "textarea", "shortName": "t"}
+            },
+            "layout": {"sidebar": {"order": ["widget_1"]}},
+        },
+    )
+    async def test_items__built_on_fetch(self, mock_get, reddit):
+        widgets = SubredditWidgets(Subreddit(reddit, "fake_subreddit"))
+        await widgets.refresh()
+        items = await widgets.items()
+        assert isinstance(items["widget_1"], TextArea)
+        assert items["widget_1"].subreddit == widgets.subreddit
+        assert await widgets.items() is items
+        mock_get.assert_awaited_once()
 
     def test_repr(self, reddit):
         widgets = SubredditWidgets(Subreddit(reddit, "fake_subreddit"))
@@ -34,12 +67,127 @@ class TestSubredditWidgets(UnitTest):
         widgets = SubredditWidgets(Subreddit(reddit, "fake_subreddit"))
         assert isinstance(widgets.mod, SubredditWidgetsModeration)
 
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_widgets_mod_create__encodes_subreddits(self, mock_post, reddit):
+        subreddit = Subreddit(reddit, "fake_subreddit")
+        await subreddit.widgets.mod.add_community_list(
+            data=[Subreddit(reddit, "redditdev"), "python"],
+            short_name="Related",
+            styles={},
+        )
+        payload = loads(mock_post.call_args.kwargs["data"]["json"])
+        assert payload["data"] == ["redditdev", "python"]
+        assert payload["kind"] == "community-list"
+
     def test_widget_mod(self, reddit):
         w = Widget(reddit, {})
         assert isinstance(w.mod, WidgetModeration)
         assert w.mod.widget == w
 
 
+class TestSubredditWidgetsModeration(UnitTest):
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_add_custom_widget__invalid(self, mock_post, reddit):
+        widgets_mod = SubredditWidgets(Subreddit(reddit, "fake_subreddit")).mod
+        kwargs = {
+            "css": "",
+            "height": 200,
+            "image_data": [],
+            "short_name": "title",
+            "styles": {},
+            "text": "text",
+        }
+        with pytest.raises(ValueError) as excinfo:
+            await widgets_mod.add_custom_widget(**{**kwargs, "css": "*" * 100001})
+        assert str(excinfo.value) == "'css' must be 100000 characters or less."
+        for height in (49, 501):
+            with pytest.raises(ValueError) as excinfo:
+                await widgets_mod.add_custom_widget(**{**kwargs, "height": height})
+            assert str(excinfo.value) == "'height' must be between 50 and 500."
+        mock_post.assert_not_awaited()
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_add_text_area__short_name_too_long(self, mock_post, reddit):
+        widgets_mod = SubredditWidgets(Subreddit(reddit, "fake_subreddit")).mod
+        with pytest.raises(ValueError) as excinfo:
+            await widgets_mod.add_text_area(short_name="x" * 31, styles={}, text="")
+        assert str(excinfo.value) == "'short_name' must be 30 characters or less."
+        mock_post.assert_not_awaited()
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_upload_image__mimetype(self, mock_post, reddit, tmp_path):
+        mock_post.return_value = {
+            "s3UploadLease": {
+                "action": "//bucket",
+                "fields": [{"name": "key", "value": "image_key"}],
+            }
+        }
+        http = MagicMock()
+        response = MagicMock()
+        http.post.return_value.__aenter__.return_value = response
+        widgets_mod = SubredditWidgets(Subreddit(reddit, "fake_subreddit")).mod
+        with mock.patch.object(reddit, "_http", http):
+            for name, mime_type in [
+                ("image.GIF", "image/gif"),
+                ("image.png", "image/png"),
+                ("image.jpg", "image/jpeg"),
+            ]:
+                image = tmp_path / name
+                image.write_bytes(b"")
+                url = await widgets_mod.upload_image(str(image))
+                assert url == "https://bucket/image_key"
+                assert mock_post.call_args.kwargs["data"] == {
+                    "filepath": name,
+                    "mimetype": mime_type,
+                }
+                response.raise_for_status.assert_called_once_with()
+                http.post.return_value.__aexit__.assert_awaited()
+                response.reset_mock()
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=AsyncMock)
+    async def test_upload_image__trailing_slash(self, mock_post, reddit, tmp_path):
+        mock_post.return_value = {
+            "s3UploadLease": {
+                "action": "//bucket/",
+                "fields": [{"name": "key", "value": "image_key"}],
+            }
+        }
+        http = MagicMock()
+        http.post.return_value.__aenter__.return_value = MagicMock()
+        image = tmp_path / "image.png"
+        image.write_bytes(b"")
+        widgets_mod = SubredditWidgets(Subreddit(reddit, "fake_subreddit")).mod
+        with mock.patch.object(reddit, "_http", http):
+            url = await widgets_mod.upload_image(str(image))
+        assert url == "https://bucket/image_key"
+        assert http.post.call_args.args[0] == "https://bucket"
+
+    @mock.patch(
+        "asyncpraw.models.SubredditWidgetsModeration.upload_image",
+        new_callable=AsyncMock,
+        side_effect=lambda file_path: f"https://bucket/{file_path}",
+    )
+    async def test_upload_images(self, _, reddit):
+        widgets_mod = SubredditWidgets(Subreddit(reddit, "fake_subreddit")).mod
+        assert await widgets_mod.upload_images(["a.png", "b.jpg"]) == [
+            "https://bucket/a.png",
+            "https://bucket/b.jpg",
+        ]
+
+
+class TestWidget(UnitTest):
+    def test_equality(self, reddit):
+        widget = Widget(reddit, {"id": "Widget_ABC"})
+        assert widget == Widget(reddit, {"id": "widget_abc"})
+        assert widget == "WIDGET_abc"
+        assert widget != Widget(reddit, {"id": "widget_def"})
+
+    def test_hash(self, reddit):
+        widget = Widget(reddit, {"id": "Widget_ABC"})
+        assert hash(widget) == hash(Widget(reddit, {"id": "widget_abc"}))
+        assert widget in {Widget(reddit, {"id": "widget_abc"})}
+
+
 class TestWidgetEncoder(UnitTest):
     def test_bad_encode(self, reddit):
         data = [
@@ -60,3 +208,33 @@ class TestWidgetEncoder(UnitTest):
             Subreddit(reddit, "four"),
         ]
         assert dumps(data, cls=WidgetEncoder) == '[1, "two", {"3": 3}, "four"]'
+
+
+class TestWidgetModeration(UnitTest):
+    @mock.patch("asyncpraw.Reddit.put", new_callable=AsyncMock)
+    async def test_update__payload(self, mock_put, reddit):
+        subreddit = Subreddit(reddit, "fake_subreddit")
+        widget = TextArea(
+            reddit, {"id": "widget_abc", "shortName": "Old", "text": "Hello"}
+        )
+        widget.subreddit = subreddit
+        await widget.mod.update(shortName="New")
+        assert mock_put.call_args.args[0] == "r/fake_subreddit/api/widget/widget_abc"
+        payload = loads(mock_put.call_args.kwargs["data"]["json"])
+        assert payload == {"id": "widget_abc", "shortName": "New", "text": "Hello"}
+
+    @mock.patch("asyncpraw.Reddit.put", new_callable=AsyncMock)
+    async def test_update__encodes_objects(self, mock_put, reddit):
+        subreddit = Subreddit(reddit, "fake_subreddit")
+        widget = Widget(reddit, {"id": "widget_abc"})
+        widget.subreddit = subreddit
+        await widget.mod.update(
+            data=[AsyncPRAWBase(reddit, _data={"_secret": "no", "text": "yes"})],
+            sub=Subreddit(reddit, "redditdev"),
+        )
+        payload = loads(mock_put.call_args.kwargs["data"]["json"])
+        assert payload == {
+            "data": [{"text": "yes"}],
+            "id": "widget_abc",
+            "sub": "redditdev",
+        }
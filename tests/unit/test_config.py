@@ -43,6 +43,24 @@ class TestConfig:
                 else:
                     os.environ[env_name] = prev_environment[env_name]
 
+    def test_cache_ttl(self):
+        assert Config("DEFAULT").cache_ttl == 0
+        assert Config("DEFAULT", cache_ttl="30").cache_ttl == 30.0
+
+    def test_max_concurrent_uploads(self):
+        assert Config("DEFAULT").max_concurrent_uploads == 4
+        config = Config("DEFAULT", max_concurrent_uploads="2")
+        assert config.max_concurrent_uploads == 2
+
+    def test_max_concurrent_uploads__invalid(self):
+        for value in [0, "-1"]:
+            with pytest.raises(ValueError) as excinfo:
+                Config("DEFAULT", max_concurrent_uploads=value)
+            assert str(excinfo.value) == (
+                "max_concurrent_uploads must be at least 1, but the given value is"
+                f" {int(value)}."
+            )
+
     def test_check_for_updates__false(self):
         for value in [False, "False", "other"]:
             config = Config("DEFAULT", check_for_updates=value)
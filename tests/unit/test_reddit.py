@@ -1,6 +1,9 @@
+import asyncio
 import configparser
+import gc
 import sys
 import types
+import warnings
 
 import pytest
 from asyncprawcore import Requestor
@@ -74,6 +77,28 @@ class TestReddit(UnitTest):
             assert not reddit.requestor._http.closed
         assert reddit.requestor._http.closed
 
+    async def test_gather_uploads__cancels_remaining_on_failure(self, reddit):
+        reddit.config.max_concurrent_uploads = 1
+        blocked = asyncio.Event()
+        started = []
+
+        async def failing():
+            raise ClientException("bad upload")
+
+        async def pending():
+            started.append(True)
+            await blocked.wait()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(ClientException):
+                await reddit._gather_uploads(failing, pending, pending)
+            await asyncio.sleep(0)
+            gc.collect()
+        # the second upload started before the failure was seen; the third never did
+        assert started == [True]
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
     def test_info__invalid_param(self, reddit):
         with pytest.raises(TypeError) as excinfo:
             reddit.info(fullnames=None)
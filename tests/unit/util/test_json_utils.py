@@ -0,0 +1,29 @@
+"""Test asyncpraw.util.json_utils."""
+
+from json import dumps as json_dumps
+
+from asyncpraw.util.json_utils import dumps, loads
+
+from .. import UnitTest
+
+
+class TestJSONUtils(UnitTest):
+    def test_dumps(self):
+        data = {"document": [{"e": "text", "t": "caf\u00e9"}]}
+        dumped = dumps(data)
+        assert isinstance(dumped, str)
+        assert loads(dumped) == data
+
+    def test_dumps__default(self):
+        dumped = dumps({"subreddits": {"test"}}, default=sorted)
+        assert loads(dumped) == {"subreddits": ["test"]}
+
+    def test_dumps__json_compatible(self):
+        for data in [{1: "a"}, [2**64], {"value": 2**70}]:
+            assert loads(dumps(data)) == loads(json_dumps(data))
+
+    def test_loads(self):
+        assert loads('{"payload": {"redirect": "url"}}') == {
+            "payload": {"redirect": "url"}
+        }
+        assert loads(b'{"type": "failed"}') == {"type": "failed"}